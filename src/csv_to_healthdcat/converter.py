@@ -5,15 +5,23 @@ This module provides the core functionality for converting CSV metadata
 to RDF Turtle format according to HealthDCAT specification. 
 """
 
+from __future__ import annotations
+
+import csv
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING
 
-import pandas as pd
 from rdflib import Graph, Literal, Namespace, URIRef
 from rdflib.namespace import DCTERMS, RDF
 
+# pandas (and numpy with it) costs a few hundred ms to import; it is pulled
+# in lazily so the stdlib csv engine and plain module import skip it.
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 # Define namespaces
@@ -24,6 +32,209 @@ FOAF = Namespace("http://xmlns.com/foaf/0.1/")
 ADMS = Namespace("http://www.w3.org/ns/adms#")
 CSVW = Namespace("http://www.w3.org/ns/csvw#")
 
+# Prefix table shared by the in-memory graph and the streaming writer.
+_NAMESPACES = {
+    "dcat": DCAT,
+    "dct": DCTERMS,
+    "dcatap": DCATAP,
+    "vcard": VCARD,
+    "foaf": FOAF,
+    "adms": ADMS,
+    "rdf": RDF,
+    "csvw": CSVW,
+}
+
+# Hot-loop constants: repeated attribute lookups on the namespace objects
+# add up when executed once per row.
+_RDF_TYPE = RDF.type
+_DCAT_DATASET = DCAT.Dataset
+_DCT_TITLE = DCTERMS.title
+_DCT_DESCRIPTION = DCTERMS.description
+_DCT_PUBLISHER = DCTERMS.publisher
+_DCT_ISSUED = DCTERMS.issued
+_DCT_MODIFIED = DCTERMS.modified
+_DCT_LICENSE = DCTERMS.license
+_DCAT_THEME = DCAT.theme
+_DCAT_KEYWORD = DCAT.keyword
+_DCAT_LANDING_PAGE = DCAT.landingPage
+_FOAF_ORGANIZATION = FOAF.Organization
+_FOAF_NAME = FOAF.name
+
+# Low-cardinality columns are parsed as pandas categoricals: each distinct
+# value is stored once and rows carry integer codes, cutting the memory of
+# these columns and letting per-category work be done once.
+_CATEGORICAL_DTYPES = {
+    "publisher": "category",
+    "theme": "category",
+    "license": "category",
+}
+
+# Quads accumulated per addN flush; large enough to amortize the call,
+# small enough to keep the batch list cheap to grow.
+_ADDN_BATCH_SIZE = 10_000
+
+# Columns every input CSV must provide.
+_REQUIRED_COLUMNS = frozenset(("title", "description"))
+
+# Optional CSV columns handled by the converter, in emission order.
+_OPTIONAL_COLUMNS = (
+    "publisher",
+    "issued",
+    "modified",
+    "license",
+    "theme",
+    "keyword",
+    "landing_page",
+)
+
+
+# EU Data Theme vocabulary mapping, built once at import time rather than
+# per _get_theme_uri call, with the authority URIs preconstructed per code.
+_THEME_MAPPING = {
+    "HEALTH":  "HEAL",
+    "HEAL": "HEAL",
+    "MEDICINE": "HEAL",
+    "SCIENCE": "SCIE",
+    "EDUCATION": "EDUC",
+    "ENVIRONMENT": "ENVI",
+    "TECHNOLOGY":  "TECH",
+}
+_THEME_URI_CACHE = {
+    code: URIRef(f"http://publications.europa.eu/resource/authority/data-theme/{code}")
+    for code in set(_THEME_MAPPING.values())
+}
+
+# Publisher names repeat heavily in real catalogs, so slugs are computed in
+# a single translate pass and memoized per distinct name.
+_SLUG_TABLE = str.maketrans({" ": "-", "\t": "-"})
+_PUBLISHER_SLUG_CACHE: dict[str, str] = {}
+
+
+# Licenses and publishers are low-cardinality in practice, so cache the
+# constructed terms (URIRef validates, Literal allocates) instead of
+# rebuilding them per row. Titles/descriptions are unique and stay uncached.
+_uri_cached = lru_cache(maxsize=4096)(URIRef)
+_literal_cached = lru_cache(maxsize=4096)(Literal)
+
+
+def _publisher_slug(name: str) -> str:
+    """Return the organization URI slug for a publisher name."""
+    try:
+        return _PUBLISHER_SLUG_CACHE[name]
+    except KeyError:
+        slug = _PUBLISHER_SLUG_CACHE[name] = name.translate(_SLUG_TABLE).lower()
+        return slug
+
+
+def _check_required_columns(columns: frozenset) -> None:
+    """Raise ValueError if any required CSV column is absent."""
+    if not _REQUIRED_COLUMNS <= columns:
+        missing_columns = set(_REQUIRED_COLUMNS - columns)
+        raise ValueError(f"CSV is missing required columns: {missing_columns}")
+
+
+def _escape_literal(value: str) -> str:
+    """Escape a string for use inside a double-quoted Turtle literal."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _escape_column(values):
+    """
+    Turtle-escape a whole column of literal values in one pass.
+
+    Runs the escape chain through pandas' C-level str.replace when pandas is
+    already loaded (the default engine), so the per-row emitter interpolates
+    pre-escaped strings without calling any escape function; other engines
+    fall back to the scalar helper.
+    """
+    import sys
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and not isinstance(values, list):
+        series = pd.Series(values, dtype=object).astype(str)
+        escaped = (
+            series.str.replace("\\", "\\\\", regex=False)
+            .str.replace('"', '\\"', regex=False)
+            .str.replace("\n", "\\n", regex=False)
+            .str.replace("\r", "\\r", regex=False)
+        )
+        return escaped.to_numpy(dtype=object)
+    return [_escape_literal(str(value)) for value in values]
+
+
+# Row emitters specialized to a column shape, keyed by (id column present,
+# set of optional columns present). Real catalogs use a handful of schemas,
+# so the cache stays tiny while repeated conversions reuse compiled code.
+_EMITTER_CACHE: dict = {}
+
+
+def _get_row_emitter(has_ids: bool, optional_columns: frozenset):
+    """
+    Return a row-emitter function specialized to the given column shape.
+
+    The generic row loop carries an ``if`` per optional column and per-row
+    mask checks even when a column is absent from the CSV. This generates
+    the loop source with only the branches for columns that are actually
+    present, compiles it once and caches the function, so a typical
+    three-column CSV gets a straight-line emitter with no dead checks.
+
+    Args:
+        has_ids: Whether the CSV has an ``id`` column
+        optional_columns: Names of the optional columns present
+
+    Returns:
+        A function with the signature ``emit(converter, quads, graph,
+        seen_publishers, start, stop, offset, titles, descriptions, ids,
+        ids_mask, optional)`` that appends quads for rows ``start..stop``
+        and flushes full batches to the graph.
+    """
+    key = (has_ids, optional_columns)
+    emitter = _EMITTER_CACHE.get(key)
+    if emitter is not None:
+        return emitter
+
+    present = [name for name in _OPTIONAL_COLUMNS if name in optional_columns]
+    lines = [
+        "def _emit_rows(converter, quads, graph, seen_publishers, start, stop,",
+        "               offset, titles, descriptions, ids, ids_mask, optional):",
+        "    add = converter._add_dataset_to_graph",
+    ]
+    for name in present:
+        lines.append(f"    {name}_values, {name}_mask = optional[{name!r}]")
+    lines.append("    for i in range(start, stop):")
+    if has_ids:
+        lines += [
+            "        if ids_mask[i]:",
+            "            dataset_id = str(ids[i])",
+            "        else:",
+            '            dataset_id = f"dataset-{offset + i + 1}"',
+        ]
+    else:
+        lines.append('        dataset_id = f"dataset-{offset + i + 1}"')
+    call = ["        add(quads, graph, seen_publishers, dataset_id,"]
+    call.append("            titles[i], descriptions[i],")
+    for name in present:
+        call.append(f"            {name}={name}_values[i] if {name}_mask[i] else None,")
+    call.append("        )")
+    lines += call
+    lines += [
+        f"        if len(quads) >= {_ADDN_BATCH_SIZE}:",
+        "            graph.addN(quads)",
+        "            quads.clear()",
+    ]
+    source = "\n".join(lines) + "\n"
+
+    namespace: dict = {}
+    # The source is assembled entirely from literals above; nothing
+    # user-controlled reaches exec.
+    exec(compile(source, "<csv_to_healthdcat row emitter>", "exec"), namespace)  # noqa: S102
+    emitter = _EMITTER_CACHE[key] = namespace["_emit_rows"]
+    return emitter
 
 
 class CSVToHealthDCAT:
@@ -41,125 +252,815 @@ class CSVToHealthDCAT:
         Args:
             base_uri: Base URI for RDF resources (default: http://example.org/)
         """
-        self.base_uri = base_uri
-        self.graph:  Graph = Graph()
-        self._bind_namespaces()
+        # Normalize once so resource URIs can be built with plain string
+        # concatenation instead of a urljoin (regex parse) per row.
+        self.base_uri = base_uri if base_uri.endswith("/") else base_uri + "/"
+        self._dataset_prefix = self.base_uri + "dataset/"
+        self._org_prefix = self.base_uri + "organization/"
+        # SimpleMemory skips the reverse indices and context bookkeeping of
+        # the default Memory store, which is wasted effort for this
+        # write-once-then-serialize workload. Prefixes are bound lazily,
+        # after ingest, so the namespace manager stays out of the hot path.
+        self.graph:  Graph = Graph(store="SimpleMemory")
+        # Publishers whose foaf:Organization triples are already in the
+        # graph; rdflib dedupes on insert, but skipping the redundant adds
+        # saves two store round-trips per repeated publisher.
+        self._seen_publishers: set = set()
 
     def _bind_namespaces(self) -> None:
         """Bind common namespaces to the graph."""
-        self.graph.bind("dcat", DCAT)
-        self.graph.bind("dct", DCTERMS)
-        self.graph.bind("dcatap", DCATAP)
-        self.graph.bind("vcard", VCARD)
-        self.graph.bind("foaf", FOAF)
-        self.graph.bind("adms", ADMS)
-        self.graph.bind("rdf", RDF)
-        self.graph.bind("csvw", CSVW)
+        for prefix, namespace in _NAMESPACES.items():
+            self.graph.bind(prefix, namespace)
 
-    def convert_csv(self, csv_path: str) -> Graph:
+    @staticmethod
+    def _read_csv(csv_path: str) -> pd.DataFrame:
         """
-        Convert a CSV file to HealthDCAT RDF format. 
+        Read and validate a CSV file.
 
         Args:
             csv_path: Path to the input CSV file
 
         Returns:
-            RDFlib Graph object containing the converted metadata
+            DataFrame with the CSV contents
 
         Raises:
             FileNotFoundError: If the CSV file doesn't exist
             ValueError:  If the CSV is missing required columns or is malformed
         """
+        import pandas as pd
+
         csv_file = Path(csv_path)
         if not csv_file.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
         try:
-            df = pd.read_csv(csv_file)
+            df = pd.read_csv(csv_file, dtype=_CATEGORICAL_DTYPES)
         except Exception as e:
             raise ValueError(f"Failed to read CSV file: {e}") from e
 
-        if df.empty:
-            logger.warning("CSV file is empty")
-            return self.graph
+        # Validate before the emptiness check so a header-only CSV with
+        # missing columns raises like it does with the other engines.
+        _check_required_columns(frozenset(df.columns))
+
+        return df
+
+    @staticmethod
+    def _extract_columns(df: pd.DataFrame) -> tuple:
+        """
+        Pull the relevant columns out of a DataFrame as plain object arrays.
+
+        Extracting each column once (with a precomputed not-NA mask for the
+        optional ones) avoids materializing a pd.Series per row.
+
+        Args:
+            df: DataFrame produced by :meth:`_read_csv`
+
+        Returns:
+            Tuple of (titles, descriptions, ids, ids_mask, optional) where
+            ``optional`` maps column name to a (values, mask) pair
+        """
+        import numpy as np
+        import pandas as pd
+
+        # Empty mandatory cells are normalized to "" (here and in the other
+        # engines) and skipped at emission time.
+        titles = df["title"].fillna("").to_numpy(dtype=object)
+        descriptions = df["description"].fillna("").to_numpy(dtype=object)
+
+        if "id" in df.columns:
+            ids = df["id"].to_numpy(dtype=object)
+            ids_mask = df["id"].notna().to_numpy()
+        else:
+            ids = None
+            ids_mask = None
+
+        optional = {}
+        for column in _OPTIONAL_COLUMNS:
+            if column not in df.columns:
+                continue
+            series = df[column]
+            if column == "keyword":
+                # Split and strip the whole column in one vectorized pass
+                # so the row loop iterates prebuilt lists instead of
+                # calling split()/strip() per cell.
+                values = (
+                    series.astype(str)
+                    .str.strip()
+                    .str.split(r"\s*;\s*", regex=True)
+                    .to_numpy(dtype=object)
+                )
+            elif column in ("theme", "license") and isinstance(series.dtype, pd.CategoricalDtype):
+                # Build the URI term once per category and fan it out by
+                # code, so the row loop carries finished URIRefs.
+                if column == "theme":
+                    prepared = [
+                        CSVToHealthDCAT._get_theme_uri(str(category).upper())
+                        for category in series.cat.categories
+                    ]
+                else:
+                    prepared = [_uri_cached(str(category)) for category in series.cat.categories]
+                prepared.append(None)  # NA rows carry code -1, which indexes here
+                values = np.asarray(prepared, dtype=object)[series.cat.codes.to_numpy()]
+            else:
+                values = series.to_numpy(dtype=object)
+            optional[column] = (values, series.notna().to_numpy())
+
+        return titles, descriptions, ids, ids_mask, optional
+
+    def _load_columns(self, csv_path: str, engine: str) -> tuple | None:
+        """
+        Read a CSV with the selected engine and extract its column arrays.
+
+        Args:
+            csv_path: Path to the input CSV file
+            engine: CSV reader backend, ``"pandas"``, ``"csv"`` or
+                ``"pyarrow"``
+
+        Returns:
+            The :meth:`_extract_columns` tuple, or ``None`` for an empty CSV
+
+        Raises:
+            FileNotFoundError: If the CSV file doesn't exist
+            ValueError:  If the engine is unknown, or the CSV is missing
+                required columns or is malformed
+            ImportError: If the pyarrow engine is requested but not installed
+        """
+        if engine == "pandas":
+            df = self._read_csv(csv_path)
+            if df.empty:
+                return None
+            return self._extract_columns(df)
+        if engine == "csv":
+            return self._extract_columns_stdlib(csv_path)
+        if engine == "pyarrow":
+            return self._extract_columns_arrow(self._read_csv_arrow(csv_path))
+        raise ValueError(
+            f"Unknown CSV engine: {engine!r} (expected 'pandas', 'csv' or 'pyarrow')"
+        )
+
+    @staticmethod
+    def _extract_columns_stdlib(csv_path: str) -> tuple | None:
+        """
+        Read a CSV with the stdlib csv module into column arrays.
+
+        Produces the same layout as :meth:`_extract_columns` without
+        importing pandas at all — the converter only ever needs row
+        iteration and empty-value checks, so ``csv.DictReader`` plus
+        is-not-empty masks cover it. Columns are still accumulated in
+        full before conversion, so peak memory matches the pandas path;
+        the win here is only the avoided import.
+
+        Args:
+            csv_path: Path to the input CSV file
+
+        Returns:
+            The :meth:`_extract_columns` tuple, or ``None`` for an empty CSV
+
+        Raises:
+            FileNotFoundError: If the CSV file doesn't exist
+            ValueError: If the CSV is missing required columns or is malformed
+        """
+        csv_file = Path(csv_path)
+        if not csv_file.exists():
+            raise FileNotFoundError(f"CSV file not found: {csv_path}")
+
+        with open(csv_file, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames
+            if fieldnames is None:
+                raise ValueError("Failed to read CSV file: no header row")
+
+            columns = frozenset(fieldnames)
+            _check_required_columns(columns)
+
+            relevant = ["title", "description"]
+            if "id" in columns:
+                relevant.append("id")
+            relevant.extend(column for column in _OPTIONAL_COLUMNS if column in columns)
+
+            data: dict = {column: [] for column in relevant}
+            appenders = [(data[column].append, column) for column in relevant]
+            for row in reader:
+                for append, column in appenders:
+                    append(row.get(column))
+
+        if not data["title"]:
+            return None
+
+        # Short rows yield None from DictReader; normalize mandatory cells
+        # to "" to match the other engines.
+        titles = [value if value is not None else "" for value in data["title"]]
+        descriptions = [value if value is not None else "" for value in data["description"]]
+
+        if "id" in columns:
+            ids = data["id"]
+            ids_mask = [value not in (None, "") for value in ids]
+        else:
+            ids = None
+            ids_mask = None
+
+        optional = {}
+        for column in _OPTIONAL_COLUMNS:
+            if column not in columns:
+                continue
+            values = data[column]
+            mask = [value not in (None, "") for value in values]
+            if column == "keyword":
+                values = [
+                    [word.strip() for word in value.split(";")] if present else None
+                    for value, present in zip(values, mask)
+                ]
+            optional[column] = (values, mask)
+
+        return titles, descriptions, ids, ids_mask, optional
+
+    @staticmethod
+    def _read_csv_arrow(csv_path: str):
+        """
+        Read a CSV file with PyArrow's multi-threaded reader.
+
+        Args:
+            csv_path: Path to the input CSV file
+
+        Returns:
+            pyarrow.Table with the CSV contents
+
+        Raises:
+            FileNotFoundError: If the CSV file doesn't exist
+            ValueError: If the CSV is malformed
+            ImportError: If pyarrow is not installed
+        """
+        csv_file = Path(csv_path)
+        if not csv_file.exists():
+            raise FileNotFoundError(f"CSV file not found: {csv_path}")
+
+        try:
+            import pyarrow.csv as pacsv
+        except ImportError as e:
+            raise ImportError(
+                "The 'pyarrow' engine requires the optional pyarrow package "
+                "(pip install csv-to-healthdcat-ttl[arrow])"
+            ) from e
+
+        try:
+            # Arrow keeps "" in string columns by default; map empty cells
+            # to null so the is-not-None masks downstream treat them as
+            # absent, matching the pandas and stdlib engines.
+            return pacsv.read_csv(
+                csv_file,
+                convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to read CSV file: {e}") from e
+
+    @staticmethod
+    def _extract_columns_arrow(table) -> tuple | None:
+        """
+        Extract column arrays from a pyarrow Table.
+
+        Produces the same layout as :meth:`_extract_columns`; Arrow nulls
+        (including empty cells, see :meth:`_read_csv_arrow`) come back as
+        ``None`` from ``to_pylist()``, so the masks are plain is-not-None
+        checks over the bulk-decoded values.
+
+        Args:
+            table: pyarrow.Table produced by :meth:`_read_csv_arrow`
+
+        Returns:
+            The :meth:`_extract_columns` tuple, or ``None`` for an empty CSV
+
+        Raises:
+            ValueError: If the CSV is missing required columns
+        """
+        columns = frozenset(table.column_names)
+        _check_required_columns(columns)
+
+        if table.num_rows == 0:
+            return None
+
+        # Normalize null mandatory cells to "" to match the other engines.
+        titles = [value if value is not None else "" for value in table.column("title").to_pylist()]
+        descriptions = [
+            value if value is not None else ""
+            for value in table.column("description").to_pylist()
+        ]
+
+        if "id" in columns:
+            ids = table.column("id").to_pylist()
+            ids_mask = [value is not None for value in ids]
+        else:
+            ids = None
+            ids_mask = None
+
+        optional = {}
+        for column in _OPTIONAL_COLUMNS:
+            if column in columns:
+                values = table.column(column).to_pylist()
+                if column == "keyword":
+                    values = [
+                        None
+                        if value is None
+                        else [word.strip() for word in str(value).split(";")]
+                        for value in values
+                    ]
+                optional[column] = (values, [value is not None for value in values])
+
+        return titles, descriptions, ids, ids_mask, optional
+
+    def _iter_column_chunks(self, csv_path: str, engine: str, chunksize: int | None):
+        """
+        Iterate the CSV as (row_offset, columns) tuples.
+
+        With ``chunksize`` unset the whole file is read at once via
+        :meth:`_load_columns`; otherwise the CSV is read incrementally so at
+        most ``chunksize`` rows are resident at a time.
 
-        # Required columns
-        required_columns = {"title", "description"}
-        missing_columns = required_columns - set(df.columns)
-        if missing_columns:
-            raise ValueError(f"CSV is missing required columns: {missing_columns}")
+        Args:
+            csv_path: Path to the input CSV file
+            engine: CSV reader backend, ``"pandas"``, ``"csv"`` or
+                ``"pyarrow"``
+            chunksize: Rows per chunk, or ``None`` to read everything at once
 
-        logger.info(f"Processing {len(df)} dataset(s) from CSV")
+        Returns:
+            Iterator of (row_offset, :meth:`_extract_columns` tuple) pairs
 
-        # Process each row in the CSV
-        for idx, row in df.iterrows():
-            self._add_dataset_to_graph(row, idx)
+        Raises:
+            FileNotFoundError: If the CSV file doesn't exist
+            ValueError:  If the CSV is missing required columns or is
+                malformed, or chunked reading is requested for an engine
+                that doesn't support it
+        """
+        if chunksize is None:
+            columns = self._load_columns(csv_path, engine)
+            return iter(()) if columns is None else iter([(0, columns)])
+
+        if engine != "pandas":
+            raise ValueError("chunksize is currently only supported with the pandas engine")
+
+        import pandas as pd
+
+        csv_file = Path(csv_path)
+        if not csv_file.exists():
+            raise FileNotFoundError(f"CSV file not found: {csv_path}")
+
+        try:
+            reader = pd.read_csv(csv_file, chunksize=chunksize, dtype=_CATEGORICAL_DTYPES)
+        except Exception as e:
+            raise ValueError(f"Failed to read CSV file: {e}") from e
+
+        def generate():
+            offset = 0
+            first = True
+            with reader:
+                for chunk in reader:
+                    if first:
+                        _check_required_columns(frozenset(chunk.columns))
+                        first = False
+                    if chunk.empty:
+                        continue
+                    yield offset, self._extract_columns(chunk)
+                    offset += len(chunk)
+
+        return generate()
+
+    def convert_csv(
+        self,
+        csv_path: str,
+        engine: str = "pandas",
+        max_workers: int | None = None,
+        chunksize: int | None = None,
+    ) -> Graph:
+        """
+        Convert a CSV file to HealthDCAT RDF format.
+
+        Args:
+            csv_path: Path to the input CSV file
+            engine: CSV reader backend: ``"pandas"`` (default),
+                ``"csv"`` (stdlib reader, skips the pandas import
+                entirely) or ``"pyarrow"`` (Arrow's SIMD, multi-threaded
+                reader; needs the optional pyarrow package).
+            max_workers: Worker threads for the row-to-triple conversion.
+                ``None`` or ``1`` converts sequentially; larger values split
+                the rows across a thread pool, with one local graph per
+                worker merged into :attr:`graph` at the end.
+            chunksize: Rows to read per chunk (pandas engine only). ``None``
+                reads the whole CSV at once; a positive value caps reader
+                memory on very large inputs by converting one chunk at a
+                time.
+
+        Returns:
+            RDFlib Graph object containing the converted metadata
+
+        Raises:
+            FileNotFoundError: If the CSV file doesn't exist
+            ValueError:  If the CSV is missing required columns or is malformed
+        """
+        total_rows = 0
+        for offset, columns in self._iter_column_chunks(csv_path, engine, chunksize):
+            titles, descriptions, ids, ids_mask, optional = columns
+            n_rows = len(titles)
+
+            if max_workers is not None and max_workers > 1 and n_rows > 1:
+                workers = min(max_workers, n_rows)
+                slice_size = -(-n_rows // workers)  # ceil division
+
+                def convert_slice(
+                    start: int,
+                    # Bind the chunk loop's state as defaults so every
+                    # worker sees the iteration it was submitted in even if
+                    # a future outlives it (B023).
+                    slice_size=slice_size,
+                    n_rows=n_rows,
+                    offset=offset,
+                    titles=titles,
+                    descriptions=descriptions,
+                    ids=ids,
+                    ids_mask=ids_mask,
+                    optional=optional,
+                ) -> Graph:
+                    # Worker-local graph and seen-set: the graph union on
+                    # merge dedupes any publishers shared across slices.
+                    subgraph = Graph(store="SimpleMemory")
+                    self._populate_graph(
+                        subgraph,
+                        set(),
+                        start,
+                        min(start + slice_size, n_rows),
+                        offset,
+                        titles,
+                        descriptions,
+                        ids,
+                        ids_mask,
+                        optional,
+                    )
+                    return subgraph
+
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(convert_slice, start)
+                        for start in range(0, n_rows, slice_size)
+                    ]
+                    for future in futures:
+                        self.graph += future.result()
+            else:
+                self._populate_graph(
+                    self.graph,
+                    self._seen_publishers,
+                    0,
+                    n_rows,
+                    offset,
+                    titles,
+                    descriptions,
+                    ids,
+                    ids_mask,
+                    optional,
+                )
+
+            total_rows += n_rows
+
+        if total_rows == 0:
+            logger.warning("CSV file is empty")
+        else:
+            logger.info(f"Processed {total_rows} dataset(s) from CSV")
+
+        # Bind prefixes only now that ingest is done, so callers still get
+        # compact qnames when they serialize the returned graph.
+        self._bind_namespaces()
 
         return self.graph
 
-    def _add_dataset_to_graph(self, row: pd.Series, row_index: int) -> None:
+    def _populate_graph(
+        self,
+        graph: Graph,
+        seen_publishers: set,
+        start: int,
+        stop: int,
+        offset: int,
+        titles,
+        descriptions,
+        ids,
+        ids_mask,
+        optional,
+    ) -> None:
         """
-        Add a single dataset from a CSV row to the RDF graph. 
+        Convert a contiguous slice of rows into triples on the given graph.
 
         Args:
-            row:  Pandas series representing a CSV row
-            row_index: Index of the row (used for URI generation)
+            graph: Target graph (``self.graph`` or a worker-local one)
+            seen_publishers: Publishers whose foaf triples are already in
+                the target graph
+            start: First row index of the slice (inclusive)
+            stop: Last row index of the slice (exclusive)
+            offset: Global row offset of this chunk (for generated ids)
+            titles: Title column values
+            descriptions: Description column values
+            ids: Optional id column values, or ``None``
+            ids_mask: Not-NA mask for ``ids``, or ``None``
+            optional: Mapping of optional column name to (values, mask)
+        """
+        # The row loop is generated for the exact column set of this CSV,
+        # so absent columns cost nothing per row (see _get_row_emitter).
+        emitter = _get_row_emitter(ids is not None, frozenset(optional))
+        quads: list = []
+        emitter(
+            self,
+            quads,
+            graph,
+            seen_publishers,
+            start,
+            stop,
+            offset,
+            titles,
+            descriptions,
+            ids,
+            ids_mask,
+            optional,
+        )
+        if quads:
+            graph.addN(quads)
+
+    # Default chunk size for the streaming writer: small enough to keep
+    # memory flat, large enough that per-chunk overhead is negligible.
+    _STREAMING_CHUNKSIZE = 50_000
+
+    def convert_csv_streaming(
+        self,
+        csv_path: str,
+        output_path: str,
+        engine: str = "pandas",
+        chunksize: int | None = _STREAMING_CHUNKSIZE,
+    ) -> int:
+        """
+        Convert a CSV file straight to a Turtle file without building a graph.
+
+        Each row is translated to a pre-formatted Turtle block and written as
+        it is processed; the CSV is read in chunks, so neither the input nor
+        the output is ever fully resident in memory. Use :meth:`convert_csv`
+        when the in-memory Graph API is needed.
+
+        Args:
+            csv_path: Path to the input CSV file
+            output_path: Path to the output Turtle file
+            engine: CSV reader backend, ``"pandas"`` (default), ``"csv"``
+                or ``"pyarrow"``
+            chunksize: Rows to read per chunk (pandas engine only,
+                default 50000); ``None`` reads the whole CSV at once
+
+        Returns:
+            Number of datasets written
+
+        Raises:
+            FileNotFoundError: If the CSV file doesn't exist
+            ValueError:  If the CSV is missing required columns or is malformed
+        """
+        if engine != "pandas":
+            # The pyarrow engine reads the whole table up front.
+            chunksize = None
+
+        # Create the chunk iterator first so a missing or unreadable input
+        # fails before the output file is touched.
+        chunks = self._iter_column_chunks(csv_path, engine, chunksize)
+
+        total_rows = 0
+        # A 1 MiB buffer batches the many small block writes into few
+        # write() syscalls.
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as out:
+            out.writelines(
+                f"@prefix {prefix}: <{namespace}> .\n"
+                for prefix, namespace in _NAMESPACES.items()
+            )
+            out.write("\n")
+
+            # Publisher blocks are collected here and emitted once at the
+            # end, so a publisher shared by many datasets is written once.
+            organizations: dict = {}
+
+            for offset, columns in chunks:
+                titles, descriptions, ids, ids_mask, optional = columns
+
+                # Escape the free-text columns in bulk so the emitter can
+                # interpolate them directly into the Turtle template.
+                titles = _escape_column(titles)
+                descriptions = _escape_column(descriptions)
+
+                absent = (None, None)
+                pub_values, pub_mask = optional.get("publisher", absent)
+                iss_values, iss_mask = optional.get("issued", absent)
+                mod_values, mod_mask = optional.get("modified", absent)
+                lic_values, lic_mask = optional.get("license", absent)
+                thm_values, thm_mask = optional.get("theme", absent)
+                kw_values, kw_mask = optional.get("keyword", absent)
+                lp_values, lp_mask = optional.get("landing_page", absent)
+
+                # Collect the chunk's blocks and hand them to writelines in
+                # one call, which loops at C level instead of dispatching a
+                # Python-level write per dataset.
+                format_block = self._format_dataset_block
+                blocks = [
+                    format_block(
+                        str(ids[i])
+                        if ids is not None and ids_mask[i]
+                        else f"dataset-{offset + i + 1}",
+                        titles[i],
+                        descriptions[i],
+                        organizations,
+                        publisher=pub_values[i] if pub_mask is not None and pub_mask[i] else None,
+                        issued=iss_values[i] if iss_mask is not None and iss_mask[i] else None,
+                        modified=mod_values[i] if mod_mask is not None and mod_mask[i] else None,
+                        license=lic_values[i] if lic_mask is not None and lic_mask[i] else None,
+                        theme=thm_values[i] if thm_mask is not None and thm_mask[i] else None,
+                        keyword=kw_values[i] if kw_mask is not None and kw_mask[i] else None,
+                        landing_page=lp_values[i] if lp_mask is not None and lp_mask[i] else None,
+                    )
+                    for i in range(len(titles))
+                ]
+                out.writelines(blocks)
+
+                total_rows += len(titles)
+
+            out.writelines(
+                f"<{publisher_uri}> a foaf:Organization ;\n"
+                f'    foaf:name "{_escape_literal(publisher_name)}" .\n\n'
+                for publisher_uri, publisher_name in organizations.items()
+            )
+
+        if total_rows == 0:
+            logger.warning("CSV file is empty")
+        else:
+            logger.info(f"Streamed {total_rows} dataset(s) from CSV to {output_path}")
+
+        return total_rows
+
+    def _format_dataset_block(
+        self,
+        dataset_id: str,
+        title: object,
+        description: object,
+        organizations: dict,
+        publisher: object | None = None,
+        issued: object | None = None,
+        modified: object | None = None,
+        license: object | None = None,
+        theme: object | None = None,
+        keyword: object | None = None,
+        landing_page: object | None = None,
+    ) -> str:
+        """
+        Format a single dataset as a Turtle subject block.
+
+        Predicates are grouped under one subject with ``;`` so each dataset
+        emits a single compact block; the publisher, when present, is
+        recorded in ``organizations`` so the caller can emit each
+        foaf:Organization block exactly once after all datasets.
+
+        Args:
+            dataset_id: Identifier used for URI generation
+            title: Dataset title, already Turtle-escaped (mandatory column)
+            description: Dataset description, already Turtle-escaped
+                (mandatory column)
+            organizations: Collector mapping publisher URI to publisher name
+            publisher: Optional publisher name; ``None`` when absent or NA
+            issued: Optional issued date; ``None`` when absent or NA
+            modified: Optional modification date; ``None`` when absent or NA
+            license: Optional license URI; ``None`` when absent or NA
+            theme: Optional theme string; ``None`` when absent or NA
+            keyword: Optional list of pre-split keywords; ``None`` when absent or NA
+            landing_page: Optional landing page URI; ``None`` when absent or NA
+
+        Returns:
+            Turtle text for the dataset block
+        """
+        dataset_uri = self._dataset_prefix + dataset_id
+        lines = [f"<{dataset_uri}> a dcat:Dataset"]
+
+        # Empty mandatory cells arrive as "" and are skipped, matching the
+        # graph-based path.
+        if title:
+            lines.append(f'dct:title "{title}"')
+
+        if description:
+            lines.append(f'dct:description "{description}"')
+
+        if publisher is not None:
+            publisher_name = str(publisher)
+            publisher_uri = self._org_prefix + _publisher_slug(publisher_name)
+            lines.append(f"dct:publisher <{publisher_uri}>")
+            if publisher_uri not in organizations:
+                organizations[publisher_uri] = publisher_name
+
+        if issued is not None:
+            lines.append(f'dct:issued "{_escape_literal(str(issued))}"')
+
+        if modified is not None:
+            lines.append(f'dct:modified "{_escape_literal(str(modified))}"')
+
+        if license is not None:
+            lines.append(f"dct:license <{license}>")
+
+        if theme is not None:
+            if not isinstance(theme, URIRef):
+                theme = self._get_theme_uri(str(theme).upper())
+            lines.append(f"dcat:theme <{theme}>")
+
+        if keyword is not None:
+            keywords = ", ".join(f'"{_escape_literal(word)}"' for word in keyword)
+            lines.append(f"dcat:keyword {keywords}")
+
+        if landing_page is not None:
+            lines.append(f"dcat:landingPage <{landing_page}>")
+
+        return " ;\n    ".join(lines) + " .\n\n"
+
+    def _add_dataset_to_graph(
+        self,
+        quads: list,
+        graph: Graph,
+        seen_publishers: set,
+        dataset_id: str,
+        title: object,
+        description: object,
+        publisher: object | None = None,
+        issued: object | None = None,
+        modified: object | None = None,
+        license: object | None = None,
+        theme: object | None = None,
+        keyword: object | None = None,
+        landing_page: object | None = None,
+    ) -> None:
+        """
+        Collect the quads for a single dataset from a CSV row.
+
+        Quads are appended to ``quads`` rather than added to the graph one
+        at a time; the caller flushes the batch with ``graph.addN``, which
+        crosses the Python-to-store boundary once per batch instead of once
+        per triple.
+
+        Args:
+            quads: Batch list receiving (s, p, o, graph) tuples
+            graph: Target graph (``self.graph`` or a worker-local one)
+            seen_publishers: Publishers whose foaf triples are already queued
+            dataset_id: Identifier used for URI generation
+            title: Dataset title (mandatory column)
+            description: Dataset description (mandatory column)
+            publisher: Optional publisher name; ``None`` when absent or NA
+            issued: Optional issued date; ``None`` when absent or NA
+            modified: Optional modification date; ``None`` when absent or NA
+            license: Optional license URI; ``None`` when absent or NA
+            theme: Optional theme string; ``None`` when absent or NA
+            keyword: Optional list of pre-split keywords; ``None`` when absent or NA
+            landing_page: Optional landing page URI; ``None`` when absent or NA
         """
         # Generate dataset URI
-        dataset_id = row. get("id", f"dataset-{row_index + 1}")
-        dataset_uri = URIRef(urljoin(self.base_uri, f"dataset/{dataset_id}"))
+        dataset_uri = URIRef(self._dataset_prefix + dataset_id)
 
         # Add dataset type
-        self.graph.add((dataset_uri, RDF.type, DCAT.Dataset))
+        quads.append((dataset_uri, _RDF_TYPE, _DCAT_DATASET, graph))
 
-        # Add mandatory properties
-        title = str(row.get("title", "Unknown"))
-        self.graph.add((dataset_uri, DCTERMS.title, Literal(title)))
+        # Add mandatory properties; empty cells arrive as "" from every
+        # engine and are skipped
+        title = str(title)
+        if title:
+            quads.append((dataset_uri, _DCT_TITLE, Literal(title), graph))
 
-        description = str(row.get("description", ""))
-        if description: 
-            self.graph.add((dataset_uri, DCTERMS.description, Literal(description)))
+        description = str(description)
+        if description:
+            quads.append((dataset_uri, _DCT_DESCRIPTION, Literal(description), graph))
 
         # Add optional properties
-        if "publisher" in row and pd.notna(row["publisher"]):
-            publisher_name = str(row["publisher"])
-            publisher_uri = URIRef(
-                urljoin(self.base_uri, f"organization/{publisher_name. replace(' ', '-').lower()}")
-            )
-            self.graph.add((dataset_uri, DCTERMS.publisher, publisher_uri))
-            self.graph.add((publisher_uri, RDF.type, FOAF.Organization))
-            self.graph.add((publisher_uri, FOAF.name, Literal(publisher_name)))
+        if publisher is not None:
+            publisher_name = str(publisher)
+            publisher_uri = _uri_cached(self._org_prefix + _publisher_slug(publisher_name))
+            quads.append((dataset_uri, _DCT_PUBLISHER, publisher_uri, graph))
+            if publisher_name not in seen_publishers:
+                seen_publishers.add(publisher_name)
+                quads.append((publisher_uri, _RDF_TYPE, _FOAF_ORGANIZATION, graph))
+                quads.append((publisher_uri, _FOAF_NAME, _literal_cached(publisher_name), graph))
 
-        if "issued" in row and pd.notna(row["issued"]):
-            self.graph.add(
-                (dataset_uri, DCTERMS.issued, Literal(str(row["issued"])))
-            )
+        if issued is not None:
+            quads.append((dataset_uri, _DCT_ISSUED, Literal(str(issued)), graph))
 
-        if "modified" in row and pd.notna(row["modified"]):
-            self.graph.add(
-                (dataset_uri, DCTERMS.modified, Literal(str(row["modified"])))
-            )
+        if modified is not None:
+            quads.append((dataset_uri, _DCT_MODIFIED, Literal(str(modified)), graph))
 
-        if "license" in row and pd.notna(row["license"]):
-            license_uri = URIRef(str(row["license"]))
-            self.graph.add((dataset_uri, DCTERMS.license, license_uri))
-
-        if "theme" in row and pd.notna(row["theme"]):
-            theme_value = str(row["theme"]).upper()
-            # Map theme to EU Data Theme vocabulary
-            theme_uri = self._get_theme_uri(theme_value)
-            self.graph.add((dataset_uri, DCAT.theme, theme_uri))
-
-        if "keyword" in row and pd.notna(row["keyword"]):
-            keywords = str(row["keyword"]).split(";")
-            for keyword in keywords: 
-                self.graph.add(
-                    (dataset_uri, DCAT.keyword, Literal(keyword.strip()))
-                )
+        if license is not None:
+            if not isinstance(license, URIRef):
+                license = _uri_cached(str(license))
+            quads.append((dataset_uri, _DCT_LICENSE, license, graph))
 
-        if "landing_page" in row and pd. notna(row["landing_page"]):
-            landing_page_uri = URIRef(str(row["landing_page"]))
-            self.graph.add((dataset_uri, DCAT.landingPage, landing_page_uri))
+        if theme is not None:
+            # Map theme to EU Data Theme vocabulary (already a finished URI
+            # when the column came in as a pandas categorical)
+            if not isinstance(theme, URIRef):
+                theme = self._get_theme_uri(str(theme).upper())
+            quads.append((dataset_uri, _DCAT_THEME, theme, graph))
+
+        if keyword is not None:
+            for word in keyword:
+                quads.append((dataset_uri, _DCAT_KEYWORD, Literal(word), graph))
+
+        if landing_page is not None:
+            landing_page_uri = URIRef(str(landing_page))
+            quads.append((dataset_uri, _DCAT_LANDING_PAGE, landing_page_uri, graph))
 
         logger.debug(f"Added dataset to graph: {dataset_uri}")
 
@@ -177,17 +1078,4 @@ class CSVToHealthDCAT:
         References:
             https://publications.europa.eu/resource/authority/data-theme/
         """
-        theme_mapping = {
-            "HEALTH":  "HEAL",
-            "HEAL": "HEAL",
-            "MEDICINE": "HEAL",
-            "SCIENCE": "SCIE",
-            "EDUCATION": "EDUC",
-            "ENVIRONMENT": "ENVI",
-            "TECHNOLOGY":  "TECH",
-        }
-
-        mapped_theme = theme_mapping.get(theme, "HEAL")  # Default to HEAL
-        return URIRef(
-            f"http://publications.europa.eu/resource/authority/data-theme/{mapped_theme}"
-        )
+        return _THEME_URI_CACHE[_THEME_MAPPING.get(theme, "HEAL")]  # Default to HEAL
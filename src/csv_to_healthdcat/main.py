@@ -10,6 +10,8 @@ import logging
 import sys
 from pathlib import Path
 
+from rdflib.plugin import PluginException
+
 from csv_to_healthdcat.converter import CSVToHealthDCAT
 
 # Configure logging
@@ -51,6 +53,22 @@ def main() -> int:
         type=str,
         help="Base URI for RDF resources (default: http://example.org/)",
     )
+    parser.add_argument(
+        "--format",
+        "-f",
+        choices=["turtle", "jelly", "nt"],
+        default="turtle",
+        help=(
+            "Output RDF serialization format (default: turtle). "
+            "The binary 'jelly' format requires the optional pyjelly package."
+        ),
+    )
+    parser.add_argument(
+        "--streaming",
+        "-s",
+        action="store_true",
+        help="Write Turtle output while reading the CSV (constant memory, no in-memory graph)",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -73,10 +91,29 @@ def main() -> int:
 
         logger.info(f"Reading CSV from: {input_path}")
         converter = CSVToHealthDCAT(base_uri=args.base_uri)
-        graph = converter.convert_csv(str(input_path))
 
-        logger.info(f"Writing Turtle output to: {output_path}")
-        graph.serialize(destination=str(output_path), format="turtle")
+        if args.streaming:
+            if args.format != "turtle":
+                logger.error("--streaming currently only supports Turtle output")
+                return 1
+            count = converter.convert_csv_streaming(str(input_path), str(output_path))
+            logger.info(f"Streamed {count} dataset(s) to: {output_path}")
+        else:
+            graph = converter.convert_csv(str(input_path))
+
+            logger.info(f"Writing {args.format} output to: {output_path}")
+            try:
+                # Serializers emit many small writes; a 1 MiB buffer batches
+                # them into few write() syscalls.
+                with open(output_path, "wb", buffering=1 << 20) as out:
+                    graph.serialize(destination=out, format=args.format)
+            except PluginException:
+                logger.error(
+                    f"No serializer available for format '{args.format}'. "
+                    "For 'jelly', install the optional pyjelly package "
+                    "(pip install csv-to-healthdcat-ttl[jelly])."
+                )
+                return 1
 
         logger.info("Conversion completed successfully!")
         return 0
@@ -24,6 +24,18 @@ COVID-19 Epidemiological Data,Epidemiological data on COVID-19 cases and outcome
 Diabetes Registry,Patient registry for Type 2 diabetes management,Hospital System,2022-06-15,2024-12-18,http://creativecommons.org/licenses/by-nc/4.0/,HEALTH,diabetes;registry;patients,http://example.org/diabetes,diabetes-001"""
 
 
+@pytest.fixture
+def gapped_csv_file(tmp_path: Path, sample_csv_data: str) -> Path:
+    """Fixture providing a CSV with empty optional and mandatory cells."""
+    csv_file = tmp_path / "with_gaps.csv"
+    csv_file.write_text(
+        sample_csv_data
+        + "\nSparse Dataset,Only the required fields,,,,,,,,"
+        + "\n,,Health Authority,,,,,,,"
+    )
+    return csv_file
+
+
 @pytest.fixture
 def converter() -> CSVToHealthDCAT:
     """Fixture providing a converter instance."""
@@ -179,6 +191,157 @@ class TestCSVToHealthDCAT:
         assert "@prefix" in content
         assert "a" in content or "rdf: type" in content
 
+    def test_convert_csv_pyarrow_engine_matches_pandas(self, gapped_csv_file: Path) -> None:
+        """Test that the pyarrow engine produces the same triples as pandas."""
+        pytest.importorskip("pyarrow")
+
+        # The gapped fixture has rows with empty optional and mandatory
+        # cells — empty-vs-missing handling is where engines diverge most
+        # easily.
+        pandas_graph = CSVToHealthDCAT(base_uri="http://test.example.org/").convert_csv(
+            str(gapped_csv_file), engine="pandas"
+        )
+        arrow_graph = CSVToHealthDCAT(base_uri="http://test.example.org/").convert_csv(
+            str(gapped_csv_file), engine="pyarrow"
+        )
+        assert set(arrow_graph) == set(pandas_graph)
+        # Empty mandatory cells must not fabricate "nan"/"None" literals.
+        for graph in (pandas_graph, arrow_graph):
+            literals = {str(obj) for obj in graph.objects()}
+            assert "nan" not in literals
+            assert "None" not in literals
+
+    def test_convert_csv_stdlib_engine_matches_pandas(self, gapped_csv_file: Path) -> None:
+        """Test that the stdlib csv engine produces the same triples."""
+        pandas_graph = CSVToHealthDCAT(base_uri="http://test.example.org/").convert_csv(
+            str(gapped_csv_file), engine="pandas"
+        )
+        stdlib_graph = CSVToHealthDCAT(base_uri="http://test.example.org/").convert_csv(
+            str(gapped_csv_file), engine="csv"
+        )
+        assert set(stdlib_graph) == set(pandas_graph)
+
+    def test_header_only_csv_missing_column_raises_error(
+        self, converter: CSVToHealthDCAT, tmp_path: Path
+    ) -> None:
+        """Test that a header-only CSV missing required columns raises."""
+        csv_file = tmp_path / "header_only.csv"
+        csv_file.write_text("title,publisher")
+
+        with pytest.raises(ValueError, match="missing required columns"):
+            converter.convert_csv(str(csv_file))
+
+    def test_stdlib_engine_missing_column_raises_error(
+        self, converter: CSVToHealthDCAT, tmp_path: Path
+    ) -> None:
+        """Test that the stdlib engine validates required columns."""
+        invalid_csv = tmp_path / "invalid.csv"
+        invalid_csv.write_text("publisher,issued\nTest,2023-01-01")
+
+        with pytest.raises(ValueError, match="missing required columns"):
+            converter.convert_csv(str(invalid_csv), engine="csv")
+
+    def test_convert_csv_parallel_matches_sequential(self, temp_csv_file: Path) -> None:
+        """Test that parallel conversion produces the same triples."""
+        sequential = CSVToHealthDCAT(base_uri="http://test.example.org/").convert_csv(
+            str(temp_csv_file)
+        )
+        parallel = CSVToHealthDCAT(base_uri="http://test.example.org/").convert_csv(
+            str(temp_csv_file), max_workers=3
+        )
+        assert set(parallel) == set(sequential)
+
+    def test_convert_csv_chunked_matches_unchunked(self, temp_csv_file: Path) -> None:
+        """Test that chunked reading produces the same triples."""
+        unchunked = CSVToHealthDCAT(base_uri="http://test.example.org/").convert_csv(
+            str(temp_csv_file)
+        )
+        chunked = CSVToHealthDCAT(base_uri="http://test.example.org/").convert_csv(
+            str(temp_csv_file), chunksize=2
+        )
+        assert set(chunked) == set(unchunked)
+
+    def test_chunked_generated_ids_span_chunks(self, tmp_path: Path) -> None:
+        """Test that generated dataset ids keep counting across chunks."""
+        csv_file = tmp_path / "no_ids.csv"
+        csv_file.write_text(
+            "title,description\nA,a\nB,b\nC,c\nD,d\n"
+        )
+        converter = CSVToHealthDCAT(base_uri="http://test.example.org/")
+        graph = converter.convert_csv(str(csv_file), chunksize=2)
+
+        subjects = {str(s) for s in graph.subjects(predicate=URIRef("http://purl.org/dc/terms/title"))}
+        assert subjects == {
+            f"http://test.example.org/dataset/dataset-{n}" for n in (1, 2, 3, 4)
+        }
+
+    def test_unknown_engine_raises_error(
+        self, converter: CSVToHealthDCAT, temp_csv_file: Path
+    ) -> None:
+        """Test that an unknown CSV engine raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown CSV engine"):
+            converter.convert_csv(str(temp_csv_file), engine="polars")
+
+    def test_streaming_matches_graph_output(
+        self, converter: CSVToHealthDCAT, temp_csv_file: Path, tmp_path: Path
+    ) -> None:
+        """Test that the streaming writer emits the same triples as the graph."""
+        from rdflib import Graph
+
+        output_file = tmp_path / "streamed.ttl"
+        count = converter.convert_csv_streaming(str(temp_csv_file), str(output_file))
+        assert count == 3
+
+        streamed = Graph().parse(str(output_file), format="turtle")
+        expected = converter.convert_csv(str(temp_csv_file))
+        assert set(streamed) == set(expected)
+
+    def test_streaming_escapes_literals(
+        self, converter: CSVToHealthDCAT, tmp_path: Path
+    ) -> None:
+        """Test that quotes and backslashes in fields are escaped in Turtle."""
+        from rdflib import Graph
+
+        csv_file = tmp_path / "tricky.csv"
+        csv_file.write_text('title,description\n"The ""quoted"" set","Back\\slash"\n')
+        output_file = tmp_path / "tricky.ttl"
+
+        converter.convert_csv_streaming(str(csv_file), str(output_file))
+        graph = Graph().parse(str(output_file), format="turtle")
+
+        from rdflib.namespace import DCTERMS
+
+        titles = [str(t) for t in graph.objects(predicate=DCTERMS.title)]
+        assert titles == ['The "quoted" set']
+        descriptions = [str(d) for d in graph.objects(predicate=DCTERMS.description)]
+        assert descriptions == ["Back\\slash"]
+
+    def test_streaming_writes_each_organization_once(
+        self, converter: CSVToHealthDCAT, tmp_path: Path
+    ) -> None:
+        """Test that a shared publisher emits a single organization block."""
+        csv_file = tmp_path / "shared_publisher.csv"
+        csv_file.write_text(
+            "title,description,publisher\n"
+            "First,one,Health Authority\n"
+            "Second,two,Health Authority\n"
+        )
+        output_file = tmp_path / "shared.ttl"
+
+        converter.convert_csv_streaming(str(csv_file), str(output_file))
+        content = output_file.read_text()
+        assert content.count("a foaf:Organization") == 1
+
+    def test_streaming_empty_csv(self, converter: CSVToHealthDCAT, tmp_path: Path) -> None:
+        """Test that an empty CSV streams only prefix declarations."""
+        empty_csv = tmp_path / "empty.csv"
+        empty_csv.write_text("title,description")
+        output_file = tmp_path / "empty.ttl"
+
+        count = converter.convert_csv_streaming(str(empty_csv), str(output_file))
+        assert count == 0
+        assert "@prefix" in output_file.read_text()
+
     def test_custom_base_uri(self, temp_csv_file: Path) -> None:
         """Test converter with custom base URI."""
         custom_uri = "http://custom.example.org/data/"
@@ -202,3 +365,34 @@ class TestCSVToHealthDCAT:
 
         datasets = list(graph.subjects(predicate=RDF.type, object=DCAT.Dataset))
         assert len(datasets) >= 3
+
+    def test_specialized_emitter_minimal_columns(
+        self, converter: CSVToHealthDCAT, tmp_path: Path
+    ) -> None:
+        """Test that a CSV with only required columns converts correctly."""
+        csv_file = tmp_path / "minimal.csv"
+        csv_file.write_text("title,description\nDataset A,First dataset\nDataset B,Second dataset")
+        graph = converter.convert_csv(str(csv_file))
+
+        from rdflib.namespace import DCTERMS
+
+        titles = {str(title) for title in graph.objects(predicate=DCTERMS.title)}
+        assert titles == {"Dataset A", "Dataset B"}
+
+    def test_specialized_emitter_is_cached(
+        self, temp_csv_file: Path, tmp_path: Path
+    ) -> None:
+        """Test that converting the same column shape reuses one emitter."""
+        from csv_to_healthdcat import converter as converter_module
+
+        converter_module._EMITTER_CACHE.clear()
+        CSVToHealthDCAT().convert_csv(str(temp_csv_file))
+        assert len(converter_module._EMITTER_CACHE) == 1
+
+        CSVToHealthDCAT().convert_csv(str(temp_csv_file))
+        assert len(converter_module._EMITTER_CACHE) == 1
+
+        minimal_csv = tmp_path / "minimal.csv"
+        minimal_csv.write_text("title,description\nDataset A,First dataset")
+        CSVToHealthDCAT().convert_csv(str(minimal_csv))
+        assert len(converter_module._EMITTER_CACHE) == 2